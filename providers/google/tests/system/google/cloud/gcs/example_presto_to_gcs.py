@@ -52,12 +52,18 @@ BUCKET_NAME = f"bucket_{DAG_ID}_{ENV_ID}"
 SOURCE_MULTIPLE_TYPES = "memory.default.test_multiple_types"
 SOURCE_CUSTOMER_TABLE = "tpch.sf1.customer"
 
+SAFE_NAME_RE = re.compile("[^0-9a-zA-Z_]+")
+
 
 def safe_name(s: str) -> str:
     """
     Remove invalid characters for filename
     """
-    return re.sub("[^0-9a-zA-Z_]+", "_", s)
+    return SAFE_NAME_RE.sub("_", s)
+
+
+SAFE_MULTIPLE_TYPES = safe_name(SOURCE_MULTIPLE_TYPES)
+SAFE_CUSTOMER_TABLE = safe_name(SOURCE_CUSTOMER_TABLE)
 
 
 with DAG(
@@ -81,7 +87,7 @@ with DAG(
         task_id="presto_to_gcs_basic",
         sql=f"select * from {SOURCE_MULTIPLE_TYPES}",
         bucket=BUCKET_NAME,
-        filename=f"{safe_name(SOURCE_MULTIPLE_TYPES)}.{{}}.json",
+        filename=f"{SAFE_MULTIPLE_TYPES}.{{}}.json",
     )
     # [END howto_operator_presto_to_gcs_basic]
 
@@ -90,8 +96,8 @@ with DAG(
         task_id="presto_to_gcs_multiple_types",
         sql=f"select * from {SOURCE_MULTIPLE_TYPES}",
         bucket=BUCKET_NAME,
-        filename=f"{safe_name(SOURCE_MULTIPLE_TYPES)}.{{}}.json",
-        schema_filename=f"{safe_name(SOURCE_MULTIPLE_TYPES)}-schema.json",
+        filename=f"{SAFE_MULTIPLE_TYPES}.{{}}.json",
+        schema_filename=f"{SAFE_MULTIPLE_TYPES}-schema.json",
         gzip=False,
     )
     # [END howto_operator_presto_to_gcs_multiple_types]
@@ -100,12 +106,12 @@ with DAG(
     create_external_table_multiple_types = BigQueryCreateTableOperator(
         task_id="create_external_table_multiple_types",
         dataset_id=DATASET_NAME,
-        table_id=f"{safe_name(SOURCE_MULTIPLE_TYPES)}",
+        table_id=SAFE_MULTIPLE_TYPES,
         table_resource={
             "tableReference": {
                 "projectId": PROJECT_ID,
                 "datasetId": DATASET_NAME,
-                "tableId": f"{safe_name(SOURCE_MULTIPLE_TYPES)}",
+                "tableId": SAFE_MULTIPLE_TYPES,
             },
             "schema": {
                 "fields": [
@@ -117,10 +123,10 @@ with DAG(
                 "sourceFormat": "NEWLINE_DELIMITED_JSON",
                 "compression": "NONE",
                 "csvOptions": {"skipLeadingRows": 1},
-                "sourceUris": [f"gs://{BUCKET_NAME}/{safe_name(SOURCE_MULTIPLE_TYPES)}.*.json"],
+                "sourceUris": [f"gs://{BUCKET_NAME}/{SAFE_MULTIPLE_TYPES}.*.json"],
             },
         },
-        gcs_schema_object=f"gs://{BUCKET_NAME}/{safe_name(SOURCE_MULTIPLE_TYPES)}-schema.json",
+        gcs_schema_object=f"gs://{BUCKET_NAME}/{SAFE_MULTIPLE_TYPES}-schema.json",
     )
     # [END howto_operator_create_external_table_multiple_types]
 
@@ -129,7 +135,7 @@ with DAG(
         configuration={
             "query": {
                 "query": f"SELECT COUNT(*) FROM `{PROJECT_ID}.{DATASET_NAME}."
-                f"{safe_name(SOURCE_MULTIPLE_TYPES)}`",
+                f"{SAFE_MULTIPLE_TYPES}`",
                 "useLegacySql": False,
             }
         },
@@ -140,8 +146,8 @@ with DAG(
         task_id="presto_to_gcs_many_chunks",
         sql=f"select * from {SOURCE_CUSTOMER_TABLE}",
         bucket=BUCKET_NAME,
-        filename=f"{safe_name(SOURCE_CUSTOMER_TABLE)}.{{}}.json",
-        schema_filename=f"{safe_name(SOURCE_CUSTOMER_TABLE)}-schema.json",
+        filename=f"{SAFE_CUSTOMER_TABLE}.{{}}.json",
+        schema_filename=f"{SAFE_CUSTOMER_TABLE}-schema.json",
         approx_max_file_size_bytes=10_000_000,
         gzip=False,
     )
@@ -150,12 +156,12 @@ with DAG(
     create_external_table_many_chunks = BigQueryCreateTableOperator(
         task_id="create_external_table_many_chunks",
         dataset_id=DATASET_NAME,
-        table_id=f"{safe_name(SOURCE_CUSTOMER_TABLE)}",
+        table_id=SAFE_CUSTOMER_TABLE,
         table_resource={
             "tableReference": {
                 "projectId": PROJECT_ID,
                 "datasetId": DATASET_NAME,
-                "tableId": f"{safe_name(SOURCE_CUSTOMER_TABLE)}",
+                "tableId": SAFE_CUSTOMER_TABLE,
             },
             "schema": {
                 "fields": [
@@ -167,10 +173,10 @@ with DAG(
                 "sourceFormat": "NEWLINE_DELIMITED_JSON",
                 "compression": "NONE",
                 "csvOptions": {"skipLeadingRows": 1},
-                "sourceUris": [f"gs://{BUCKET_NAME}/{safe_name(SOURCE_CUSTOMER_TABLE)}.*.json"],
+                "sourceUris": [f"gs://{BUCKET_NAME}/{SAFE_CUSTOMER_TABLE}.*.json"],
             },
         },
-        gcs_schema_object=f"gs://{BUCKET_NAME}/{safe_name(SOURCE_CUSTOMER_TABLE)}-schema.json",
+        gcs_schema_object=f"gs://{BUCKET_NAME}/{SAFE_CUSTOMER_TABLE}-schema.json",
     )
 
     # [START howto_operator_read_data_from_gcs_many_chunks]
@@ -179,7 +185,7 @@ with DAG(
         configuration={
             "query": {
                 "query": f"SELECT COUNT(*) FROM `{PROJECT_ID}.{DATASET_NAME}."
-                f"{safe_name(SOURCE_CUSTOMER_TABLE)}`",
+                f"{SAFE_CUSTOMER_TABLE}`",
                 "useLegacySql": False,
             }
         },
@@ -191,8 +197,8 @@ with DAG(
         task_id="presto_to_gcs_csv",
         sql=f"select * from {SOURCE_MULTIPLE_TYPES}",
         bucket=BUCKET_NAME,
-        filename=f"{safe_name(SOURCE_MULTIPLE_TYPES)}.{{}}.csv",
-        schema_filename=f"{safe_name(SOURCE_MULTIPLE_TYPES)}-schema.json",
+        filename=f"{SAFE_MULTIPLE_TYPES}.{{}}.csv",
+        schema_filename=f"{SAFE_MULTIPLE_TYPES}-schema.json",
         export_format="csv",
     )
     # [END howto_operator_presto_to_gcs_csv]